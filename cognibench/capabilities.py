@@ -32,6 +32,43 @@ class PredictsLogpdf(sciunit.Capability):
         super().__init__(*args, **kwargs)
 
 
+class TrajectoryPredictable(sciunit.Capability):
+    """
+    Capability for interactive models that can predict a whole trajectory in one call.
+
+    The interactive prediction loop alternates `predict` and `update` calls per trial, which pays
+    Python dispatch overhead at every step. Models whose recurrence can be replayed inside a
+    single compiled or vectorized routine may declare this capability; interactive tests then
+    call :py:meth:`predict_trajectory` once per subject instead of looping over the trials.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def predict_trajectory(self, stimuli, rewards, actions):
+        """
+        Predict every trial of a trajectory in one call, advancing the hidden state exactly as
+        alternating `predict`/`update` calls would.
+
+        Parameters
+        ----------
+        stimuli : array-like
+            Sequence of stimuli, one per trial.
+
+        rewards : array-like
+            Sequence of rewards, one per trial.
+
+        actions : array-like
+            Sequence of actions, one per trial.
+
+        Returns
+        -------
+        predictions : array-like
+            One prediction per trial, each evaluated before that trial's update.
+        """
+        raise NotImplementedError("Must implement predict_trajectory.")
+
+
 class ProducesPolicy(sciunit.Capability):
     """
     Capability for agents that can generate a policy function over the action space. A policy function returns the
@@ -44,6 +81,58 @@ class ProducesPolicy(sciunit.Capability):
     def eval_policy(self, *args, **kwargs):
         raise NotImplementedError("Must implement eval_policy.")
 
+    def eval_policy_batch(self, stimuli, actions):
+        """
+        Evaluate the policy on a batch of stimulus-action pairs at once.
+
+        Agents whose policy has no trial-to-trial state dependence (or can be evaluated in a batched
+        manner) may override this method to return the logpdf/logpmf value of every action in a single
+        call. Fitting procedures such as :class:`cognibench.models.policy_model.PolicyModel` use this
+        method, when available, instead of evaluating the policy one trial at a time.
+
+        Parameters
+        ----------
+        stimuli : array-like
+            Sequence of stimuli.
+
+        actions : array-like
+            Sequence of actions, one per stimulus.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Array of logpdf/logpmf values, one per stimulus-action pair.
+        """
+        raise NotImplementedError("Optionally implement eval_policy_batch.")
+
+    def predict_and_update(self, stimulus, reward, action):
+        """
+        Evaluate the policy for the given action and update the hidden state in a single call.
+
+        Stateful agents usually derive the policy and the state update from the same internal
+        value estimates, so evaluating them separately repeats part of the computation and pays
+        two method dispatches per trial. Agents may override this method to perform both steps at
+        once. Fitting procedures such as :class:`cognibench.models.policy_model.PolicyModel` use
+        this method, when available, instead of separate `eval_policy` and `update` calls.
+
+        Parameters
+        ----------
+        stimulus : array-like
+            A single stimulus.
+
+        reward : float
+            The reward of the action.
+
+        action : array-like
+            The action performed by the subject.
+
+        Returns
+        -------
+        float
+            logpdf/logpmf value of the given action under the policy before the update.
+        """
+        raise NotImplementedError("Optionally implement predict_and_update.")
+
 
 class MultiSubjectModel(sciunit.Capability):
     """
@@ -1,8 +1,12 @@
 import numpy as np
 import scipy.stats as stats
 
+_HALF_LOG_2PI = 0.5 * np.log(2 * np.pi + 1e-8)
+
 
 class DiscreteRV:
+    __slots__ = ("n", "_p", "_logp", "random_state")
+
     def __init__(self, p, eps=1e-8):
         self.n = len(p)
         self._p = p
@@ -17,18 +21,51 @@ class DiscreteRV:
 
 
 class NormalRV:
+    __slots__ = ("loc", "scale", "eps", "random_state", "_inv_scale", "_log_const")
+
     def __init__(self, loc, scale, eps=1e-8):
         self.loc = loc
         self.scale = scale
         self.eps = eps
         self.random_state = None
+        # logpdf is typically evaluated many times per distribution (once per trial in scoring
+        # loops); precompute the scale-dependent constants so each evaluation is a subtraction,
+        # a multiplication and a square.
+        self._inv_scale = 1.0 / (scale + eps)
+        self._log_const = -np.log(scale + eps) - _HALF_LOG_2PI
 
     def logpdf(self, e):
-        return (
-            -np.log(self.scale + self.eps)
-            - 0.5 * np.log(2 * np.pi + self.eps)
-            - 0.5 * ((e - self.loc) / (self.scale + self.eps)) ** 2
-        )
+        return self._log_const - 0.5 * ((e - self.loc) * self._inv_scale) ** 2
 
     def rvs(self):
         return self.random_state.normal(self.loc, self.scale)
+
+
+class NormalLogpdfBatch:
+    """
+    Sequence of per-trial normal logpdf functions sharing a common scale, backed by one array of
+    means. Indexing yields the logpdf function of a single trial, so the object can replace a
+    list of per-trial logpdf callables; consumers that know about the `batch` method (see
+    :py:func:`cognibench.utils.negloglike`) can instead evaluate every trial's action with a
+    single vectorized expression.
+    """
+
+    __slots__ = ("locs", "scale", "_inv_scale", "_log_const")
+
+    def __init__(self, locs, scale, eps=1e-8):
+        self.locs = np.asarray(locs, dtype=np.float64)
+        self.scale = scale
+        self._inv_scale = 1.0 / (scale + eps)
+        self._log_const = -np.log(scale + eps) - _HALF_LOG_2PI
+
+    def __len__(self):
+        return len(self.locs)
+
+    def __getitem__(self, idx):
+        return NormalRV(loc=self.locs[idx], scale=self.scale).logpdf
+
+    def batch(self, actions):
+        d = (
+            np.asarray(actions, dtype=np.float64).reshape(-1) - self.locs
+        ) * self._inv_scale
+        return self._log_const - 0.5 * d * d
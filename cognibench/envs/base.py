@@ -10,6 +10,9 @@ class CNBEnv(gym.Env):
 
     name = "CNBEnv"
 
+    # number of uniform draws generated at once by :py:meth:`_next_uniform`.
+    _UNIFORM_BUF_SIZE = 1 << 16
+
     def __init__(self, *args, seed=None, **kwargs):
         """
         Parameters
@@ -29,8 +32,27 @@ class CNBEnv(gym.Env):
             Seed for the random_state
         """
         self.np_random, seed = seeding.np_random(seed)
+        # drop any pre-drawn uniform buffer so that subsequent draws follow the new seed.
+        self._uniform_buf = None
         return seed
 
+    def _next_uniform(self):
+        """
+        Return a single uniform draw from [0, 1).
+
+        Generating one scalar per `np_random.uniform()` call pays a fixed NumPy dispatch cost per
+        draw; environments that consume one or two uniforms per step are dominated by it over long
+        runs. This helper pre-draws a large buffer and serves scalars from it, refilling when
+        exhausted, so the dispatch cost is amortized over the buffer size.
+        """
+        buf = getattr(self, "_uniform_buf", None)
+        if buf is None or self._uniform_pos == len(buf):
+            self._uniform_buf = self.np_random.uniform(size=self._UNIFORM_BUF_SIZE)
+            self._uniform_pos = 0
+        u = self._uniform_buf[self._uniform_pos]
+        self._uniform_pos += 1
+        return float(u)
+
     def update(self, stimulus, reward, action, done=False):
         """
         Method to update the internal state of the environment. If you have a stateful environment, override this method
@@ -28,6 +28,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import numpy as np
 from gym.utils import seeding
 from cognibench.capabilities import (
     ContinuousAction,
@@ -83,6 +84,7 @@ class BanditEnv(DiscreteAction, DiscreteObservation, CNBEnv):
 
         self.n_bandits = len(p_dist)
         self.p_dist = p_dist
+        self._p_dist_arr = np.asarray(p_dist)
         self.info = info
         self.set_seed(seed)
         self.set_action_space(self.n_bandits)
@@ -107,19 +109,56 @@ class BanditEnv(DiscreteAction, DiscreteObservation, CNBEnv):
         info : str
             Information about the environment.
         """
-        assert self.get_action_space().contains(
-            action
-        ), "Action does not fit in the environment's action_space"
+        # gym space membership checks are pure overhead for trusted agent loops; keep the
+        # assertion as a debug guard so it disappears under `python -O`.
+        if __debug__:
+            assert self.get_action_space().contains(
+                action
+            ), "Action does not fit in the environment's action_space"
         reward = 0
         done = False
         observation = 0
         info = self.info
 
-        if self.np_random.uniform() < self.p_dist[action]:
+        if self._next_uniform() < self.p_dist[action]:
             reward = 1
 
         return observation, reward, done, info
 
+    def step_many(self, actions):
+        """Environment reacts to a batch of agent actions at once.
+
+        Semantically equivalent to calling :py:meth:`step` once per action, but all the
+        random draws are performed in a single vectorized operation.
+
+        Parameters
+        ----------
+        actions : array-like
+            Sequence of actions taken by the agent.
+
+        Returns
+        -------
+        observations : :class:`numpy.ndarray`
+            No observation for n-bandit test (all zeros).
+        rewards : :class:`numpy.ndarray`
+            1 or 0 for each action, generated by the p_dist.
+        dones : :class:`numpy.ndarray`
+            Whether the environment has been exceeded (all False).
+        info : str
+            Information about the environment.
+        """
+        actions = np.asarray(actions)
+        assert all(
+            self.get_action_space().contains(a) for a in actions
+        ), "Action does not fit in the environment's action_space"
+        n = len(actions)
+        rewards = (
+            self.np_random.uniform(size=n) < self._p_dist_arr[actions]
+        ).astype(int)
+        observations = np.zeros(n, dtype=int)
+        dones = np.zeros(n, dtype=bool)
+        return observations, rewards, dones, self.info
+
     def reset(self):
         """Reset the n-bandit env.
 
@@ -195,6 +234,13 @@ class ClassicalConditioningEnv(ContinuousAction, MultiBinaryObservation, CNBEnv)
         self.stimuli = stimuli
         self.p_stimuli = p_stimuli
         self.p_reward = p_reward
+        self._stim_arr = np.asarray(stimuli)
+        self._p_stimuli_arr = np.asarray(p_stimuli)
+        self._p_reward_arr = np.asarray(p_reward)
+        # cumulative stimulus probabilities allow O(log n) inverse-CDF sampling of stimulus
+        # indices from a single uniform draw, without the per-call normalization and setup
+        # np_random.choice performs.
+        self._cum_p_stimuli = np.cumsum(self._p_stimuli_arr)
         self.info = info
         self.set_seed(seed)
 
@@ -217,23 +263,59 @@ class ClassicalConditioningEnv(ContinuousAction, MultiBinaryObservation, CNBEnv)
         info : str
             Information about the environment.
         """
-        assert self.get_action_space().contains(
-            action
-        ), "Action does not fit in the environment's action_space"
+        # see BanditEnv.step for the rationale of the debug guard.
+        if __debug__:
+            assert self.get_action_space().contains(
+                action
+            ), "Action does not fit in the environment's action_space"
 
-        obs_idx = self.np_random.choice(
-            range(len(self.stimuli)), p=self.p_stimuli, replace=True
-        )
+        obs_idx = self._sample_stim_idx()
         reward = 0
         done = False
         observation = self.stimuli[obs_idx]
         info = self.info
 
-        if self.np_random.uniform() < self.p_reward[obs_idx]:
+        if self._next_uniform() < self.p_reward[obs_idx]:
             reward = 1
 
         return observation, reward, done, info
 
+    def step_many(self, actions):
+        """Environment reacts to a batch of agent actions at once.
+
+        Semantically equivalent to calling :py:meth:`step` once per action, but the stimulus
+        indices and rewards are all drawn in single vectorized operations.
+
+        Parameters
+        ----------
+        actions : array-like
+            Sequence of actions taken by the agent.
+
+        Returns
+        -------
+        observations : :class:`numpy.ndarray`
+            One stimulus from the pre-set list for each action.
+        rewards : :class:`numpy.ndarray`
+            1 or 0 for each action, generated by the p_reward of the drawn stimulus.
+        dones : :class:`numpy.ndarray`
+            Whether the environment has been exceeded (all False).
+        info : str
+            Information about the environment.
+        """
+        assert all(
+            self.get_action_space().contains(a) for a in actions
+        ), "Action does not fit in the environment's action_space"
+        n = len(actions)
+        obs_indices = np.searchsorted(
+            self._cum_p_stimuli, self.np_random.uniform(size=n)
+        )
+        rewards = (
+            self.np_random.uniform(size=n) < self._p_reward_arr[obs_indices]
+        ).astype(int)
+        observations = self._stim_arr[obs_indices]
+        dones = np.zeros(n, dtype=bool)
+        return observations, rewards, dones, self.info
+
     def reset(self):
         """Reset the env.
 
@@ -245,8 +327,13 @@ class ClassicalConditioningEnv(ContinuousAction, MultiBinaryObservation, CNBEnv)
         observation : :class:`numpy.ndarray`
             One of the stimulus from the pre-set list
         """
-        obs_idx = self.np_random.choice(
-            range(len(self.stimuli)), p=self.p_stimuli, replace=True
-        )
+        obs_idx = self._sample_stim_idx()
         observation = self.stimuli[obs_idx]
         return observation
+
+    def _sample_stim_idx(self):
+        """
+        Draw a single stimulus index from the stimulus distribution using the cumulative
+        probabilities precomputed in `__init__`.
+        """
+        return int(np.searchsorted(self._cum_p_stimuli, self._next_uniform()))
@@ -0,0 +1,74 @@
+"""
+Compiled trajectory kernel for the LSSPD (RWPH) model.
+
+Replaying a trajectory through `predict`/`update` pairs performs a handful of tiny NumPy
+operations per trial; for the small observation dimensions typical of associative learning tasks
+the interpreter and ufunc dispatch overhead dominates the arithmetic. This module provides the
+whole per-trial recurrence as a single numba-compiled loop so a full trajectory is processed in
+one call. numba is an optional dependency; without it the same function runs as pure Python with
+identical semantics.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        def deco(fn):
+            return fn
+
+        return deco
+
+
+@njit(cache=True)
+def run_trajectory(stimuli, rewards, w, alpha, b0, b1, mix_coef, eta, kappa):
+    """
+    Replay a whole trajectory of the LSSPD recurrence, updating `w` and `alpha` in place exactly
+    as repeated :py:meth:`LSSPDAgent.update` calls would.
+
+    Parameters
+    ----------
+    stimuli : :class:`numpy.ndarray`
+        Float array of shape (n_trials, n_obs) containing one stimulus per row.
+
+    rewards : :class:`numpy.ndarray`
+        Float array of shape (n_trials,) containing the reward of each trial.
+
+    w : :class:`numpy.ndarray`
+        Weight vector of shape (n_obs,). Modified in place.
+
+    alpha : :class:`numpy.ndarray`
+        Associability vector of shape (n_obs,). Modified in place.
+
+    b0, mix_coef, eta, kappa : float
+        Scalar model parameters; see :class:`LSSPDAgent` for their meaning.
+
+    b1 : :class:`numpy.ndarray`
+        Slope vector of shape (n_obs,).
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Array of shape (n_trials,) with the policy mean of every trial, evaluated before that
+        trial's update.
+    """
+    n_trials, n_obs = stimuli.shape
+    mu_preds = np.empty(n_trials)
+    for t in range(n_trials):
+        mu = b0
+        rhat = 0.0
+        for j in range(n_obs):
+            s = stimuli[t, j]
+            mu += b1[j] * s * (mix_coef * w[j] + (1.0 - mix_coef) * alpha[j])
+            rhat += s * w[j]
+        mu_preds[t] = mu
+        delta = rewards[t] - rhat
+        for j in range(n_obs):
+            s = stimuli[t, j]
+            w[j] += kappa * delta * alpha[j] * s
+            a = alpha[j] + s * (eta * abs(delta) - eta * alpha[j])
+            if a > 1.0:
+                a = 1.0
+            alpha[j] = a
+    return mu_preds
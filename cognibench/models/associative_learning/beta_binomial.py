@@ -105,10 +105,7 @@ class BetaBinomialAgent(
 
         mu_pred = self._predict_reward(stimulus)
 
-        rv = NormalRV(loc=mu_pred, scale=sd_pred)
-        rv.random_state = self.rng
-
-        return rv
+        return NormalRV(loc=mu_pred, scale=sd_pred)
 
     def act(self, stimulus):
         """
@@ -125,7 +122,11 @@ class BetaBinomialAgent(
         float
             An action from the continuous action space.
         """
-        return self.eval_policy(stimulus).rvs()
+        rv = self.eval_policy(stimulus)
+        # the random state only matters when actually sampling, so it is bound here instead of
+        # on every policy evaluation.
+        rv.random_state = self.rng
+        return rv.rvs()
 
     def update(self, stimulus, reward, action, done=False):
         """
@@ -2,16 +2,18 @@ import numpy as np
 import gym
 from gym import spaces
 from scipy import stats
-from cognibench.distr import NormalRV
+from cognibench.distr import NormalRV, NormalLogpdfBatch
 from cognibench.models import CNBAgent
 from cognibench.models.policy_model import PolicyModel
 from cognibench.capabilities import (
     ProducesPolicy,
+    TrajectoryPredictable,
     ContinuousAction,
     MultiBinaryObservation,
 )
 from cognibench.continuous import ContinuousSpace
 from cognibench.utils import is_arraylike
+from cognibench.models.associative_learning._lsspd_kernel import run_trajectory
 from overrides import overrides
 
 
@@ -71,10 +73,17 @@ class LSSPDAgent(CNBAgent, ProducesPolicy, ContinuousAction, MultiBinaryObservat
         float
             An action from the continuous action space.
         """
-        return self.eval_policy(*args, **kwargs).rvs()
+        rv = self.eval_policy(*args, **kwargs)
+        # the random state only matters when actually sampling, so it is bound here instead of
+        # on every policy evaluation.
+        rv.random_state = self.rng
+        return rv.rvs()
 
     def _predict_reward(self, stimulus):
-        assert self.get_observation_space().contains(stimulus)
+        # gym space membership checks cost as much as the update math itself for small
+        # observation dimensions; keep them as debug guards so they disappear under `python -O`.
+        if __debug__:
+            assert self.get_observation_space().contains(stimulus)
         w_curr = self.get_hidden_state()["w"]
         rhat = np.dot(stimulus, w_curr.T)
         return rhat
@@ -100,15 +109,15 @@ class LSSPDAgent(CNBAgent, ProducesPolicy, ContinuousAction, MultiBinaryObservat
         done : bool
             If True, do not update the hidden state.
         """
-        assert self.get_action_space().contains(action)
-        assert self.get_observation_space().contains(stimulus)
+        # see _predict_reward for the rationale of the debug guard.
+        if __debug__:
+            assert self.get_action_space().contains(action)
+            assert self.get_observation_space().contains(stimulus)
 
-        eta = self.get_paras()[
-            "eta"
-        ]  # Proportion of pred. error. in the updated associability value
-        kappa = self.get_paras()[
-            "kappa"
-        ]  # Fixed learning rate for the cue weight update
+        # cached in `reset`; proportion of pred. error in the updated associability value and
+        # fixed learning rate for the cue weight update, respectively.
+        eta = self._eta
+        kappa = self._kappa
 
         w_curr = self.get_hidden_state()["w"]
         alpha = self.get_hidden_state()["alpha"]
@@ -118,10 +127,18 @@ class LSSPDAgent(CNBAgent, ProducesPolicy, ContinuousAction, MultiBinaryObservat
         if not done:
             delta = reward - rhat
 
-            w_curr += kappa * delta * alpha * stimulus  # alpha, stimulus size: (n_obs,)
+            # all updates are written through the scratch buffers allocated in `reset` so that
+            # no per-trial temporaries are created; note that the alpha update must read the
+            # pre-update alpha*stimulus product, hence the buffered copy in `self._alpha_stim`.
+            np.multiply(alpha, stimulus, out=self._alpha_stim)
+            np.multiply(self._alpha_stim, kappa * delta, out=self._scratch)
+            w_curr += self._scratch  # alpha, stimulus size: (n_obs,)
 
-            alpha += stimulus * (eta * abs(delta) - eta * alpha)
-            alpha = np.minimum(alpha, 1)
+            np.multiply(stimulus, eta * abs(delta), out=self._scratch)
+            alpha += self._scratch
+            np.multiply(self._alpha_stim, eta, out=self._scratch)
+            alpha -= self._scratch
+            np.minimum(alpha, 1, out=alpha)
 
             self.get_hidden_state()["w"] = w_curr
             self.get_hidden_state()["alpha"] = alpha
@@ -145,25 +162,69 @@ class LSSPDAgent(CNBAgent, ProducesPolicy, ContinuousAction, MultiBinaryObservat
             reward using b0 and b1 parameters, and standard deviation equal
             to sigma model parameter.
         """
-        assert self.get_observation_space().contains(stimulus)
+        # see _predict_reward for the rationale of the debug guard.
+        if __debug__:
+            assert self.get_observation_space().contains(stimulus)
 
-        b0 = self.get_paras()["b0"]
-        b1 = self.get_paras()["b1"]
-        sd_pred = self.get_paras()["sigma"]
-        mix_coef = self.get_paras()["mix_coef"]
+        # cached in `reset` to avoid the four dict lookups per policy evaluation.
+        b0 = self._b0
+        b1 = self._b1
+        sd_pred = self._sigma
+        mix_coef = self._mix_coef
 
         w_curr = self.get_hidden_state()["w"]
         alpha = self.get_hidden_state()["alpha"]
 
-        # Predict response
-        mu_pred = b0 + np.dot(
-            b1, stimulus * (mix_coef * w_curr + (1 - mix_coef) * alpha)
-        )
+        # Predict response; the convex combination is built in the scratch buffers to avoid
+        # allocating the intermediate vectors on every policy evaluation.
+        np.multiply(w_curr, mix_coef, out=self._scratch)
+        np.multiply(alpha, 1 - mix_coef, out=self._alpha_stim)
+        self._scratch += self._alpha_stim
+        self._scratch *= stimulus
+        mu_pred = b0 + np.dot(b1, self._scratch)
 
-        rv = NormalRV(loc=mu_pred, scale=sd_pred)
-        rv.random_state = self.rng
+        return NormalRV(loc=mu_pred, scale=sd_pred)
+
+    def predict_trajectory(self, stimuli, rewards):
+        """
+        Replay a whole trajectory in a single compiled call instead of alternating `eval_policy`
+        and `update` per trial. The hidden state is advanced exactly as the per-trial methods
+        would advance it.
+
+        Parameters
+        ----------
+        stimuli : array-like
+            Sequence of stimuli from the multi-binary observation space, one per trial.
 
-        return rv
+        rewards : array-like
+            Sequence of rewards, one per trial.
+
+        Returns
+        -------
+        list
+            List with the logpdf function of each trial's policy, evaluated before that trial's
+            update.
+        """
+        paras = self.get_paras()
+        hidden = self.get_hidden_state()
+        w = np.ascontiguousarray(hidden["w"], dtype=np.float64)
+        alpha = np.ascontiguousarray(hidden["alpha"], dtype=np.float64)
+        b1 = np.ascontiguousarray(paras["b1"], dtype=np.float64)
+        mu_preds = run_trajectory(
+            np.ascontiguousarray(stimuli, dtype=np.float64),
+            np.ascontiguousarray(rewards, dtype=np.float64),
+            w,
+            alpha,
+            float(paras["b0"]),
+            b1,
+            float(paras["mix_coef"]),
+            float(paras["eta"]),
+            float(paras["kappa"]),
+        )
+        hidden["w"] = w
+        hidden["alpha"] = alpha
+        sd_pred = paras["sigma"]
+        return [NormalRV(loc=mu, scale=sd_pred).logpdf for mu in mu_preds]
 
     @overrides
     def reset(self):
@@ -176,9 +237,23 @@ class LSSPDAgent(CNBAgent, ProducesPolicy, ContinuousAction, MultiBinaryObservat
                 "alpha": self.get_paras()["alpha"] * np.ones(self.n_obs()),
             }
         )
-
-
-class LSSPDModel(PolicyModel, ContinuousAction, MultiBinaryObservation):
+        # scratch buffers reused by `update` and `eval_policy` to avoid per-trial temporaries.
+        self._scratch = np.empty(self.n_obs())
+        self._alpha_stim = np.empty(self.n_obs())
+        # cache the parameter scalars read on every trial as plain attributes; `set_paras`
+        # triggers a reset, so the cache is refreshed whenever the parameters change.
+        paras = self.get_paras()
+        self._b0 = paras["b0"]
+        self._b1 = paras["b1"]
+        self._sigma = paras["sigma"]
+        self._mix_coef = paras["mix_coef"]
+        self._eta = paras["eta"]
+        self._kappa = paras["kappa"]
+
+
+class LSSPDModel(
+    PolicyModel, TrajectoryPredictable, ContinuousAction, MultiBinaryObservation
+):
     """
     LSSPD (Rescorla Wagner Pearce Hall, RWPH) model implementation.
     """
@@ -218,3 +293,36 @@ class LSSPDModel(PolicyModel, ContinuousAction, MultiBinaryObservation):
         super().__init__(
             *args, agent=agent, param_initializer=initializer, seed=seed, **kwargs
         )
+
+    @overrides
+    def predict_trajectory(self, stimuli, rewards, actions):
+        """
+        Predict a whole trajectory in one call by delegating to the underlying agent's compiled
+        trajectory replay; see :py:meth:`LSSPDAgent.predict_trajectory`.
+        """
+        return self.agent.predict_trajectory(stimuli, rewards)
+
+    def predict_batch(self, stimuli):
+        """
+        Evaluate the policy for a whole batch of stimuli with the hidden state held fixed,
+        computing all the policy means in a single matrix-vector product instead of one
+        `predict` call per stimulus.
+
+        Parameters
+        ----------
+        stimuli : array-like
+            Sequence of stimuli from the multi-binary observation space, one per row.
+
+        Returns
+        -------
+        :class:`cognibench.distr.NormalLogpdfBatch`
+            Per-stimulus logpdf functions backed by the batched policy means.
+        """
+        paras = self.agent.get_paras()
+        hidden = self.agent.get_hidden_state()
+        mix_coef = paras["mix_coef"]
+        combined = np.asarray(paras["b1"]) * (
+            mix_coef * hidden["w"] + (1 - mix_coef) * hidden["alpha"]
+        )
+        mu = paras["b0"] + np.asarray(stimuli, dtype=np.float64).dot(combined)
+        return NormalLogpdfBatch(mu, paras["sigma"])
@@ -71,10 +71,7 @@ class RandomRespondAgent(
         mu_pred = self.get_paras()["mu"]
         sd_pred = self.get_paras()["sigma"]
 
-        rv = NormalRV(loc=mu_pred, scale=sd_pred)
-        rv.random_state = self.rng
-
-        return rv
+        return NormalRV(loc=mu_pred, scale=sd_pred)
 
     def act(self, stimulus):
         """
@@ -91,7 +88,11 @@ class RandomRespondAgent(
         float
             An action from the continuous action space.
         """
-        return self.eval_policy(stimulus).rvs()
+        rv = self.eval_policy(stimulus)
+        # the random state only matters when actually sampling, so it is bound here instead of
+        # on every policy evaluation.
+        rv.random_state = self.rng
+        return rv.rvs()
 
     def update(self, stimulus, reward, action, done=False):
         """
@@ -65,7 +65,11 @@ class RwNormAgent(CNBAgent, ProducesPolicy, ContinuousAction, MultiBinaryObserva
         float
             An action from the continuous action space.
         """
-        return self.eval_policy(*args, **kwargs).rvs()
+        rv = self.eval_policy(*args, **kwargs)
+        # the random state only matters when actually sampling, so it is bound here instead of
+        # on every policy evaluation.
+        rv.random_state = self.rng
+        return rv.rvs()
 
     def _predict_reward(self, stimulus):
         assert self.get_observation_space().contains(stimulus)
@@ -138,10 +142,7 @@ class RwNormAgent(CNBAgent, ProducesPolicy, ContinuousAction, MultiBinaryObserva
         # Predict response
         mu_pred = b0 + np.dot(b1, stimulus * w_curr)
 
-        rv = NormalRV(loc=mu_pred, scale=sd_pred)
-        rv.random_state = self.rng
-
-        return rv
+        return NormalRV(loc=mu_pred, scale=sd_pred)
 
     @overrides
     def reset(self):
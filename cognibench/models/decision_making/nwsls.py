@@ -72,7 +72,6 @@ class NWSLSAgent(CNBAgent, ProducesPolicy, DiscreteAction, DiscreteObservation):
                 pk[a] = epsilon / n
 
         rv = DiscreteRV(pk)
-        rv.random_state = self.rng
         # xk = np.arange(n)
         # rv = stats.rv_discrete(name=None, values=(xk, pk))
         # rv.random_state = self.rng
@@ -93,7 +92,11 @@ class NWSLSAgent(CNBAgent, ProducesPolicy, DiscreteAction, DiscreteObservation):
         int
             An action from the action space.
         """
-        return self.eval_policy(stimulus).rvs()
+        rv = self.eval_policy(stimulus)
+        # the random state only matters when actually sampling, so it is bound here instead of
+        # on every policy evaluation.
+        rv.random_state = self.rng
+        return rv.rvs()
 
     def update(self, stimulus, reward, action, done=False):
         """
@@ -60,7 +60,6 @@ class RandomRespondAgent(CNBAgent, ProducesPolicy, DiscreteAction, DiscreteObser
         pk = np.full(n, (1 - bias) / (n - 1))
         pk[action_bias] = bias
         rv = DiscreteRV(pk)
-        rv.random_state = self.rng
 
         # xk = np.arange(n)
         # rv = stats.rv_discrete(values=(xk, pk))
@@ -82,7 +81,11 @@ class RandomRespondAgent(CNBAgent, ProducesPolicy, DiscreteAction, DiscreteObser
         int
             An action from the action space.
         """
-        return self.eval_policy(stimulus).rvs()
+        rv = self.eval_policy(stimulus)
+        # the random state only matters when actually sampling, so it is bound here instead of
+        # on every policy evaluation.
+        rv.random_state = self.rng
+        return rv.rvs()
 
     def update(self, stimulus, reward, action, done=False):
         """
@@ -83,7 +83,6 @@ class RWCKAgent(CNBAgent, ProducesPolicy, DiscreteAction, DiscreteObservation):
         # xk = np.arange(self.n_action())
         pk = softmax(V)
         rv = DiscreteRV(pk)
-        rv.random_state = self.rng
         # rv = stats.rv_discrete(values=(xk, pk))
         # rv.random_state = self.rng
 
@@ -103,7 +102,11 @@ class RWCKAgent(CNBAgent, ProducesPolicy, DiscreteAction, DiscreteObservation):
         int
             An action from the action space.
         """
-        return self.eval_policy(stimulus).rvs()
+        rv = self.eval_policy(stimulus)
+        # the random state only matters when actually sampling, so it is bound here instead of
+        # on every policy evaluation.
+        rv.random_state = self.rng
+        return rv.rvs()
 
     def update(self, stimulus, reward, action, done=False):
         """
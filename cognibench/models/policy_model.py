@@ -1,5 +1,5 @@
 from cognibench.logging import logger
-from cognibench.utils import negloglike, is_arraylike
+from cognibench.utils import is_arraylike
 from scipy.optimize import minimize
 import numpy as np
 from collections.abc import Mapping
@@ -73,12 +73,29 @@ class PolicyModel(CNBModel, Interactive, PredictsLogpdf, ReturnsNumParams):
         return self.agent.get_paras()
 
     @overrides
-    def fit(self, stimuli, rewards, actions):
+    def fit(self, stimuli, rewards, actions, dtype=np.float64):
         """
         Fit the model by minimizing the negative log-likelihood of the model predictions using
         :py:func:`scipy.optimize.minimize`. f and x0 parameters to the function is computed here; all
         the other keyword arguments can be modified in class initialization by providing 'optim_kwargs'
         argument.
+
+        `dtype` controls the data type of the flat parameter array passed to the optimizer. It
+        defaults to `np.float64`, the working type of :py:func:`scipy.optimize.minimize`, so that
+        SciPy does not have to promote (and copy) the array on every objective evaluation. Pass
+        `np.float32` only when coupling to an agent kernel that operates in single precision and
+        the promotion cost is paid deliberately.
+
+        Since the objective function is evaluated many times by the optimizer, agents may optionally
+        provide a `numba_kernel` attribute to move the whole negative log-likelihood computation out of
+        the Python interpreter. If set, it must be a (typically `numba.njit` compiled) function with the
+        signature
+
+            `numba_kernel(param_array, stimuli, rewards, actions) -> float`
+
+        where `param_array` is the flat parameter array in the same layout as produced by flattening
+        the agent parameter dictionary, and the return value is the negative log-likelihood of the
+        given trajectory. The kernel is responsible for interpreting the parameter layout itself.
         """
         if "args" in self.optim_kwargs:
             raise ValueError(
@@ -86,7 +103,19 @@ class PolicyModel(CNBModel, Interactive, PredictsLogpdf, ReturnsNumParams):
             )
 
         self.init_paras()
-        x0, lens = _flatten_dict_into_array(self.agent.get_paras())
+        x0, lens = _flatten_dict_into_array(self.agent.get_paras(), dtype=dtype)
+        # the parameter layout (key list and slice objects) is invariant as long as the parameter
+        # keys stay the same; cache it across fits so that each objective evaluation avoids
+        # walking the dictionary and re-deriving begin/end indices.
+        param_keys = tuple(self.agent.get_paras().keys())
+        layout = getattr(self, "_param_layout", None)
+        if layout is None or layout[0] != param_keys:
+            param_slices = [
+                slice(int(beg), int(end)) for beg, end in zip(lens[:-1], lens[1:])
+            ]
+            self._param_layout = (param_keys, param_slices)
+        else:
+            param_slices = layout[1]
         optim_kwargs = {k: v for k, v in self.optim_kwargs.items()}
         optim_kwargs["args"] = (lens,)
         if "bounds" not in optim_kwargs:
@@ -97,15 +126,54 @@ class PolicyModel(CNBModel, Interactive, PredictsLogpdf, ReturnsNumParams):
                 bounds = None
             optim_kwargs["bounds"] = bounds
 
+        # agents may provide a compiled objective kernel; in that case the whole negative
+        # log-likelihood computation is performed outside the interpreter.
+        numba_kernel = getattr(self.agent, "numba_kernel", None)
+        if numba_kernel is not None:
+            kernel_data = (
+                np.ascontiguousarray(stimuli, dtype=np.float64),
+                np.ascontiguousarray(rewards, dtype=np.float64),
+                np.ascontiguousarray(actions, dtype=np.float64),
+            )
+
+        # if the agent can evaluate its policy in a batched manner, we can skip the per-trial loop in
+        # the objective function altogether.
+        has_batch_policy = (
+            type(self.agent).eval_policy_batch is not ProducesPolicy.eval_policy_batch
+        )
+        # similarly, agents may fuse policy evaluation and hidden-state update into one call,
+        # halving the per-trial dispatch overhead in the objective loop.
+        predict_and_update = (
+            self.agent.predict_and_update
+            if type(self.agent).predict_and_update
+            is not ProducesPolicy.predict_and_update
+            else None
+        )
+        trials = list(zip(stimuli, rewards, actions))
+        n_trials = len(trials)
+
         def f(x, lens):
-            _unpack_array_into_dict(self.agent.get_paras(), x, lens)
-            predictions = []
-            # TODO: essentially the same logic as InteractiveTesting; refactor?
+            if numba_kernel is not None:
+                return numba_kernel(
+                    np.ascontiguousarray(x, dtype=np.float64), *kernel_data
+                )
+            _unpack_array_into_dict_fast(
+                self.agent.get_paras(), x, param_keys, param_slices
+            )
             self.reset()
-            for s, r, a in zip(stimuli, rewards, actions):
-                predictions.append(self.predict(s))
-                self.update(s, r, a)
-            return negloglike(actions, predictions)
+            if has_batch_policy:
+                logps = self.agent.eval_policy_batch(stimuli, actions)
+            elif predict_and_update is not None:
+                logps = np.empty(n_trials)
+                for t, (s, r, a) in enumerate(trials):
+                    logps[t] = predict_and_update(s, r, a)
+            else:
+                # TODO: essentially the same logic as InteractiveTesting; refactor?
+                logps = np.empty(n_trials)
+                for t, (s, r, a) in enumerate(trials):
+                    logps[t] = self.predict(s)(a)
+                    self.update(s, r, a)
+            return -np.sum(logps)
 
         opt_res = minimize(f, x0, **optim_kwargs)
         if not opt_res.success:
@@ -114,6 +182,9 @@ class PolicyModel(CNBModel, Interactive, PredictsLogpdf, ReturnsNumParams):
             )
 
         _unpack_array_into_dict(self.agent.get_paras(), opt_res.x, lens)
+        # agents may cache parameter-derived values in `reset` (see e.g. LSSPDAgent); reset after
+        # the final unpack so those caches reflect the fitted parameters.
+        self.reset()
 
         logger().debug(
             f"Agent parameters has been set to the outputs of optimization procedure."
@@ -164,7 +235,35 @@ def _unpack_array_into_dict(dictionary, arr, beg_indices):
             dictionary[k][0 : end - beg] = arr[beg:end]
 
 
-def _flatten_dict_into_array(dictionary, dtype=np.float32):
+def _unpack_array_into_dict_fast(dictionary, arr, keys, slices):
+    """
+    Faster variant of :py:func:`_unpack_array_into_dict` intended for hot paths. Instead of walking
+    the dictionary keys and deriving begin/end indices on every call, it reuses a precomputed key
+    list and slice objects describing the parameter layout.
+
+    Parameters
+    ----------
+    dictionary : dict
+        Dictionary to assign the unpacked values to.
+
+    arr : `numpy.ndarray`
+        Array containing the values to unpack.
+
+    keys : list
+        Precomputed list of dictionary keys, in iteration order.
+
+    slices : list of slice
+        Precomputed slice objects such that the values for `keys[i]` are stored in `arr[slices[i]]`.
+    """
+    for k, s in zip(keys, slices):
+        n = s.stop - s.start
+        if n == 1:
+            dictionary[k] = arr[s.start]
+        else:
+            dictionary[k][0:n] = arr[s]
+
+
+def _flatten_dict_into_array(dictionary, dtype=np.float64):
     """
     Flatten the given dictionary into an array of scalars, and return the beginning index of each sequence of values.
 
@@ -185,11 +284,17 @@ def _flatten_dict_into_array(dictionary, dtype=np.float32):
         Integer array containing the beginning index of each sequence of scalars in `arr`. `i`th value of the dictionary,
         defined as `dictionary[list(dictionary.keys())[i]]` can be obtained as `arr[beg_indices[i]:beg_indices[i+1]]`.
     """
-    beg_indices = np.array(
-        [0] + [len(v) if is_arraylike(v) else 1 for v in dictionary.values()],
+    # length computation avoids the per-value is_arraylike (np.ndim) dispatch and the
+    # intermediate Python list; beg_indices is filled in-place by cumsum.
+    n_values = len(dictionary)
+    beg_indices = np.empty(n_values + 1, dtype=np.int32)
+    beg_indices[0] = 0
+    lens = np.fromiter(
+        (len(v) if hasattr(v, "__len__") else 1 for v in dictionary.values()),
         dtype=np.int32,
+        count=n_values,
     )
-    beg_indices = np.cumsum(beg_indices)
+    np.cumsum(lens, out=beg_indices[1:])
     arr = np.empty(beg_indices[-1], dtype=dtype)
     for i, v in enumerate(dictionary.values()):
         beg, end = beg_indices[i], beg_indices[i + 1]
@@ -1,6 +1,5 @@
 import gym
 import types
-from functools import partial
 import sciunit
 import numpy as np
 from cognibench.capabilities import Interactive, MultiSubjectModel
@@ -30,6 +29,34 @@ def multi_from_single_cls(single_cls):
     )
 
 
+class SingleSubjectAdapter:
+    """
+    Lightweight single-subject view of a multi-subject model created by
+    :py:func:`multi_from_single_cls`.
+
+    The view exposes the subject model's own bound methods under the usual single-subject method
+    names, so it can be passed anywhere a single-subject model is expected. Unlike
+    :py:func:`single_from_multi_obj`, constructing a view does not mutate the multi-subject model
+    at all: testing loops can create one view per subject without paying the per-method
+    setattr/delattr churn of wrapping and unwrapping the model, and the model itself can be used
+    concurrently.
+
+    Attributes that are not forwarded methods (e.g. `name`) are read from the underlying
+    multi-subject model.
+    """
+
+    def __init__(self, model, subj_idx):
+        assert isinstance(model, MultiSubjectModel)
+        subject_model = model.subject_models[subj_idx]
+        for fn_name in model.multi_subject_methods:
+            setattr(self, fn_name, getattr(subject_model, fn_name))
+        self._model = model
+        self._subj_idx = subj_idx
+
+    def __getattr__(self, name):
+        return getattr(self.__dict__["_model"], name)
+
+
 def single_from_multi_obj(model, subj_idx):
     """
     Temporarily convert a multi-subject model object created by multi_from_single_cls to a single-subject object
@@ -56,17 +83,13 @@ def single_from_multi_obj(model, subj_idx):
     """
     assert isinstance(model, MultiSubjectModel)
 
-    def make_new_fn(old_fn):
-        def new_fn(self, *args, **kwargs):
-            return old_fn(subj_idx, *args, **kwargs)
-
-        return new_fn
-
+    # install the subject model's own bound methods instead of wrapper closures; each call then
+    # goes straight to the subject model with no extra dispatch layer.
+    subject_model = model.subject_models[subj_idx]
     for fn_name in model.multi_subject_methods:
         old_fn = getattr(model, fn_name)
-        new_fn = make_new_fn(old_fn)
         setattr(model, f"{fn_name}_multi", old_fn)
-        setattr(model, fn_name, new_fn.__get__(model))
+        setattr(model, fn_name, getattr(subject_model, fn_name))
     return model
 
 
@@ -133,13 +156,11 @@ class MultiMeta(type):
             and not (f.startswith("__") and f.endswith("__"))
         ]
 
-        def multi_init(self, *args, n_subj, **kwargs):
-            self.subject_models = []
-            for _ in range(n_subj):
-                self.subject_models.append(single_cls(*args, **kwargs))
-            self.n_subjects = len(self.subject_models)
-
-            def new_fn(*args, fn_name, **kwargs):
+        def make_multi_fn(fn_name):
+            # a regular function (unlike functools.partial) is a descriptor, so each call binds
+            # the actual instance and dispatches straight to the subject model's bound method,
+            # instead of going through a partial -> closure -> getattr chain per call.
+            def multi_fn(self, *args, **kwargs):
                 if len(args) == 0:
                     idx = 0
                 else:
@@ -147,8 +168,17 @@ class MultiMeta(type):
                     args = args[1:]
                 return getattr(self.subject_models[idx], fn_name)(*args, **kwargs)
 
-            for fn_name in methods_to_define:
-                setattr(out_cls, fn_name, partial(new_fn, fn_name=fn_name))
+            multi_fn.__name__ = fn_name
+            return multi_fn
+
+        for fn_name in methods_to_define:
+            setattr(out_cls, fn_name, make_multi_fn(fn_name))
+
+        def multi_init(self, *args, n_subj, **kwargs):
+            self.subject_models = []
+            for _ in range(n_subj):
+                self.subject_models.append(single_cls(*args, **kwargs))
+            self.n_subjects = len(self.subject_models)
 
         def fit_jointly(self, *args, **kwargs):
             """
@@ -169,14 +199,13 @@ class MultiMeta(type):
                 keyword arguments.
             """
             # TODO: provide an example of item (2) above.
+            # snapshot kwargs.items() once instead of rescanning the dict for every subject.
+            kwargs_items = tuple(kwargs.items())
             for i, model in enumerate(self.subject_models):
-                curr_args = []
-                curr_kwargs = dict()
-                for arg in args:
-                    curr_args.append(arg[i])
-                for k, v in kwargs.items():
-                    curr_kwargs[k] = v[i]
-                model.fit(*curr_args, **curr_kwargs)
+                model.fit(
+                    *[arg[i] for arg in args],
+                    **{k: v[i] for k, v in kwargs_items},
+                )
 
         out_cls.__init__ = multi_init
         out_cls.fit_jointly = fit_jointly
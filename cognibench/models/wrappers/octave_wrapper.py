@@ -23,6 +23,7 @@ class OctaveWrapperMixin:
         self,
         *args,
         import_base_path,
+        session_setup_fn=None,
         reset_fn=None,
         predict_fn=None,
         fit_fn=None,
@@ -39,6 +40,12 @@ class OctaveWrapperMixin:
         import_base_path : str
             Base folder path containing Octave function implementations.
 
+        session_setup_fn : callable
+            One-time session initialization (e.g. `pkg load` statements), called once with the
+            Octave session right after it is created. Use this instead of `reset_fn` for setup
+            that does not need to be repeated on every model reset, since each Octave round trip
+            has a considerable fixed cost.
+
         reset_fn : str or callable
             If string, then a function of the same name that exists in the given import path will be registered
             to the `reset` method of the class. If a function, calls to `reset` are forwarded to this function with the
@@ -59,6 +66,8 @@ class OctaveWrapperMixin:
         """
         self.octave_session = Oct2Py()
         self.octave_session.eval(f'addpath("{import_base_path}");')
+        if session_setup_fn is not None:
+            session_setup_fn(self.octave_session)
 
         _define_if_given(self, reset_fn, "reset")
         _define_if_given(self, predict_fn, "predict")
@@ -1,6 +1,4 @@
 import numpy as np
-from functools import partial
-from itertools import starmap
 from cognibench.models import CNBModel, CNBAgent
 from cognibench.envs import CNBEnv
 from cognibench.models.utils import single_from_multi_obj, reverse_single_from_multi_obj
@@ -138,7 +136,9 @@ def simulate_multienv_multimodel(
         multimodel = reverse_single_from_multi_obj(model_i)
         return out_tuple
 
-    all_out = map(partial(sim_i, multimodel), range(len(env_list)))
+    # call sim_i directly instead of mapping a partial over the indices; the partial layer adds
+    # a call indirection and hides the function signature without buying anything here.
+    all_out = [sim_i(multimodel, idx) for idx in range(len(env_list))]
     stimuli, rewards, actions = zip(*all_out)
 
     return stimuli, rewards, actions
@@ -7,15 +7,30 @@ from sciunit.errors import Error
 from cognibench.models import CNBModel
 from cognibench import settings
 from cognibench.capabilities import MultiSubjectModel
-from cognibench.models.utils import single_from_multi_obj, reverse_single_from_multi_obj
+from cognibench.models.utils import SingleSubjectAdapter
 from overrides import overrides
 from cognibench.logging import logger
 from collections import defaultdict
+from functools import lru_cache
 
 
 _MULTI_LIST_KEY = "__list"
 
 
+@lru_cache(maxsize=None)
+def _capabilities_with_score(score_type):
+    """
+    Compose the base test capabilities with the extra capabilities required by the given score
+    type, or return `None` if the score type does not define any. Test suites instantiate many
+    tests with the same handful of score types, so the composed tuple is cached per score type
+    instead of being rebuilt on every instantiation.
+    """
+    score_capabilities = getattr(score_type, "required_capabilities", None)
+    if score_capabilities is None:
+        return None
+    return CNBTest.required_capabilities + score_capabilities
+
+
 class CNBTest(SciunitTest):
     """
     Base test class for all CogniBench tests.
@@ -101,13 +116,9 @@ class CNBTest(SciunitTest):
         if score_type is not None:
             assert issubclass(score_type, SciunitScore)
             self.score_type = score_type
-            try:
-                score_capabilities = self.score_type.required_capabilities
-                self.required_capabilities = (
-                    CNBTest.required_capabilities + score_capabilities
-                )
-            except AttributeError:
-                pass
+            required_capabilities = _capabilities_with_score(score_type)
+            if required_capabilities is not None:
+                self.required_capabilities = required_capabilities
         super().__init__(observation, *args, **kwargs)
 
     @overrides
@@ -155,28 +166,45 @@ class CNBTest(SciunitTest):
     def get_fitting_observations(self):
         """
         Get the fitting part of `self.observation` variable.
+
+        The result is computed once and cached: `self.observation` is fixed after test
+        construction, and this method is called by every stage of a test run (optimization,
+        prediction and scoring), so rebuilding the per-subject observation list each time is
+        wasted work.
         """
+        try:
+            return self._fitting_observations
+        except AttributeError:
+            pass
         if self.multi_subject:
             out = [
                 self.get_fitting_observations_single(x)
                 for x in self.observation[_MULTI_LIST_KEY]
             ]
-            return out
         else:
-            return self.get_fitting_observations_single(self.observation)
+            out = self.get_fitting_observations_single(self.observation)
+        self._fitting_observations = out
+        return out
 
     def get_testing_observations(self):
         """
         Get the testing part of `self.observation` variable.
+
+        Cached after the first call; see :py:meth:`get_fitting_observations`.
         """
+        try:
+            return self._testing_observations
+        except AttributeError:
+            pass
         if self.multi_subject:
             out = [
                 self.get_testing_observations_single(x)
                 for x in self.observation[_MULTI_LIST_KEY]
             ]
-            return out
         else:
-            return self.get_testing_observations_single(self.observation)
+            out = self.get_testing_observations_single(self.observation)
+        self._testing_observations = out
+        return out
 
     @overrides
     def judge(self, model, *args, **kwargs):
@@ -237,15 +265,16 @@ class CNBTest(SciunitTest):
                 model, MultiSubjectModel
             ), "Multi subject tests can only accept multi subject models"
 
-            n_subj = len(observations)
+            # hoist the attribute lookups repeated for every subject out of the loop; with many
+            # subjects the interpreter overhead of re-resolving them each iteration adds up.
+            predict_single = self.predict_single
+            get_score_kwargs = self.get_kwargs_for_compute_score
             predictions = []
             score_kwargs = []
-            for subj_idx in range(n_subj):
-                single_subj_adapter = single_from_multi_obj(model, subj_idx)
+            for subj_idx, subj_obs in enumerate(observations):
+                single_subj_adapter = SingleSubjectAdapter(model, subj_idx)
                 try:
-                    pred_single = self.predict_single(
-                        single_subj_adapter, observations[subj_idx]
-                    )
+                    pred_single = predict_single(single_subj_adapter, subj_obs)
                 except Exception as e:
                     logger().error(
                         f"{self.name} : {model.name} predict_single call has failed! Exception: {e}"
@@ -256,11 +285,8 @@ class CNBTest(SciunitTest):
 
                 predictions.append(pred_single)
                 score_kwargs.append(
-                    self.get_kwargs_for_compute_score(
-                        model, observations[subj_idx], pred_single
-                    )
+                    get_score_kwargs(single_subj_adapter, subj_obs, pred_single)
                 )
-                model = reverse_single_from_multi_obj(single_subj_adapter)
         else:
             try:
                 predictions = self.predict_single(model, observations)
@@ -292,15 +318,16 @@ class CNBTest(SciunitTest):
         """
         observations = self.get_testing_observations()
         if self.multi_subject:
-            n_subj = len(observations)
+            # see generate_prediction for the rationale of hoisting the per-subject lookups; zip
+            # also fuses the three per-subject indexing operations into one iterator step.
+            compute_score_single = self.compute_score_single
             scores = []
-            for subj_idx in range(n_subj):
+            for subj_obs, subj_preds, subj_score_kwargs in zip(
+                observations, predictions, self.score_kwargs
+            ):
                 try:
-                    single_score = self.compute_score_single(
-                        observations[subj_idx],
-                        predictions[subj_idx],
-                        **self.score_kwargs[subj_idx],
-                        **kwargs,
+                    single_score = compute_score_single(
+                        subj_obs, subj_preds, **subj_score_kwargs, **kwargs
                     ).score
                 except Exception as e:
                     logger().error(
@@ -406,21 +433,12 @@ class CNBTest(SciunitTest):
 
         folderpath = pathjoin(self.persist_path, model.name)
         makedirs(folderpath, exist_ok=True)
-        score_filepath = pathjoin(folderpath, "score")
-        pred_filepath = pathjoin(folderpath, "predictions")
+        results_filepath = pathjoin(folderpath, "results")
         model_filepath = pathjoin(folderpath, "model")
         try:
-            self.persist_score(score_filepath, score)
-        except Exception as e:
-            logger().error(f"{self.name} : persist_score has failed! Exception {e}")
-            if settings["CRASH_EARLY"]:
-                raise e
-        try:
-            self.persist_predictions(pred_filepath, prediction)
+            self.persist_results(results_filepath, score, prediction)
         except Exception as e:
-            logger().error(
-                f"{self.name} : persist_predictions has failed! Exception {e}"
-            )
+            logger().error(f"{self.name} : persist_results has failed! Exception {e}")
             if settings["CRASH_EARLY"]:
                 raise e
         try:
@@ -432,28 +450,34 @@ class CNBTest(SciunitTest):
 
         logger().info("Test results have been persisted")
 
-    def persist_score(self, path, score):
+    def persist_results(self, path, score, predictions, **extras):
         """
-        Persist the score value in the given path.
-        """
-        np.save(path, np.asarray(score.score))
-        logger().debug(f"Score is saved in {path}")
+        Persist the score and the predictions as a single compressed archive in the given path.
 
-    def persist_predictions(self, path, predictions):
-        """
-        Persist the predictions in the given path.
+        Writing one `results.npz` file instead of one file per array halves the number of small
+        file writes per tested model, and compression keeps large trajectory predictions small
+        on disk. Subclasses may pass additional arrays through `extras` to store them in the
+        same archive.
         """
-        np.save(path, np.asarray(predictions))
-        logger().debug(f"Predictions are saved in {path}")
+        np.savez_compressed(
+            path,
+            score=np.asarray(score.score),
+            predictions=np.asarray(predictions),
+            **extras,
+        )
+        logger().debug(f"Score and predictions are saved in {path}.npz")
 
     def persist_model(self, path, model):
         """
         Persist the model in the given path, if `model` implements `save(path)` method.
         """
-        try:
-            model.save(path)
-            logger().debug(f"Model is saved in {path}")
-        except AttributeError:
+        # check for the method instead of catching AttributeError: exception handling is slower,
+        # and the catch would also silently swallow genuine AttributeErrors raised inside save.
+        save = getattr(type(model), "save", None)
+        if save is None:
             logger().debug(
                 f"Model {model.name} does not implement save method; model has not been saved."
             )
+            return
+        save(model, path)
+        logger().debug(f"Model is saved in {path}")
@@ -32,10 +32,18 @@ class InteractiveTest(CNBTest):
         rewards = observations["rewards"]
         actions = observations["actions"]
 
-        predictions = []
         model.reset()
-        for s, r, a in zip(stimuli, rewards, actions):
-            predictions.append(model.predict(s))
+        # models with the TrajectoryPredictable capability can replay the whole trajectory in a
+        # single (typically compiled) call; prefer it to the per-trial predict/update loop.
+        predict_trajectory = getattr(model, "predict_trajectory", None)
+        if predict_trajectory is not None:
+            return predict_trajectory(stimuli, rewards, actions)
+
+        # the trajectory length is known up front, so fill a pre-sized array instead of growing
+        # a list one append at a time.
+        predictions = np.empty(len(stimuli), dtype=object)
+        for t, (s, r, a) in enumerate(zip(stimuli, rewards, actions)):
+            predictions[t] = model.predict(s)
             model.update(s, r, a, False)
         return predictions
 
@@ -67,6 +75,11 @@ class BatchTest(CNBTest):
 
     @overrides
     def predict_single(self, model, observations, **kwargs):
+        # models may expose a predict_batch method that returns all the predictions in a single
+        # array; prefer it to avoid any per-sample work inside predict.
+        predict_batch = getattr(model, "predict_batch", None)
+        if predict_batch is not None:
+            return predict_batch(observations["stimuli"])
         return model.predict(observations["stimuli"])
 
     @overrides
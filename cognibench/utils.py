@@ -60,6 +60,11 @@ def negloglike(actions, predictions):
     float
         Negative log-likelihood.
     """
+    # prediction sequences may expose a `batch` method returning the logpdf/logpmf value of every
+    # action at once; prefer it to evaluating the per-trial callables in a Python loop.
+    batch = getattr(predictions, "batch", None)
+    if batch is not None:
+        return -float(np.sum(batch(actions)))
     out = float(0)
     for act, logpdf in zip(actions, predictions):
         out -= logpdf(act)
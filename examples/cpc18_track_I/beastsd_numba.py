@@ -0,0 +1,311 @@
+"""
+In-process, Numba-compiled reference implementation of the BEAST.sd prediction model.
+
+The Octave and R contestants cross an inter-process boundary (Octave session, R bridge) on every
+predict call, which dominates the actual simulation cost when judging thousands of CPC18 rows.
+This module ports the `CPC18_BEASTsd_pred` Monte-Carlo simulation of `beastsd_contestant_0` to
+scalar NumPy loops that `numba.njit` compiles to native code, so a whole estimation set can be
+predicted without leaving the Python process. If numba is not installed, the same functions run
+as plain (slow) Python, so the module stays importable.
+
+The problem setup (lottery distribution expansion) is reused from the Python contestant to keep
+the two implementations directly comparable.
+"""
+import numpy as np
+from beastsd_contestant_0.CPC18_getDist import CPC18_getDist
+
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def decorator(fn):
+            return fn
+
+        return decorator
+
+
+@njit(cache=True)
+def _dist_sample(numbers, probabilities, rnd_num):
+    """
+    Sample a single number from a discrete distribution given a uniform draw `rnd_num`.
+    Same semantics as `beastsd_contestant_0.distSample`.
+    """
+    cum_prob = 0.0
+    sampled_int = 0
+    while rnd_num > cum_prob:
+        cum_prob += probabilities[sampled_int]
+        sampled_int += 1
+    return numbers[sampled_int - 1]
+
+
+@njit(cache=True)
+def _get_pbetter(dist_x, dist_y, corr, accuracy):
+    """
+    Estimate the probabilities that X generates a strictly larger value than Y and vice versa.
+    Same semantics as `beastsd_contestant_0.get_pBetter`.
+    """
+    n_x_better = 0
+    n_y_better = 0
+    for _ in range(accuracy):
+        rnd_0 = np.random.uniform(0, 1)
+        rnd_1 = np.random.uniform(0, 1)
+        sample_x = _dist_sample(dist_x[:, 0], dist_x[:, 1], rnd_0)
+        if corr == 1:
+            sample_y = _dist_sample(dist_y[:, 0], dist_y[:, 1], rnd_0)
+        elif corr == -1:
+            sample_y = _dist_sample(dist_y[:, 0], dist_y[:, 1], 1 - rnd_0)
+        else:
+            sample_y = _dist_sample(dist_y[:, 0], dist_y[:, 1], rnd_1)
+        n_x_better += int(sample_x > sample_y)
+        n_y_better += int(sample_y > sample_x)
+    return n_x_better / accuracy, n_y_better / accuracy
+
+
+@njit(cache=True)
+def _simulate_one_agent(dist_a, dist_b, amb, corr, p_a_better, p_b_better):
+    """
+    Simulate one virtual BEAST.sd agent for one problem and return its mean choice rate of
+    option B in blocks of 5. Same semantics as `beastsd_contestant_0.CPC18_BEASTsd_simulation`.
+    """
+    # model free parameters
+    SIGMA = 13.0
+    KAPA = 1
+    BETA = 0.8
+    GAMA = 1.0
+    PSI = 0.56
+    THETA = 0.91
+    SIGMA_COMP = 35.0
+    WAMB = 0.11
+
+    # setting's constants
+    n_trials = 25
+    first_feedback = 6
+    n_blocks = 5
+
+    n_a = dist_a.shape[0]
+    n_b = dist_b.shape[0]
+    ambiguous = amb == 1
+
+    p_bias = np.zeros(n_trials - first_feedback + 2)
+    obs_pay = np.zeros((n_trials - first_feedback + 1, 2))
+    decision = np.zeros(n_trials)
+    sim_pred = np.zeros(n_blocks)
+
+    # check for complexity of the problem
+    if max(n_a, n_b) > 2 and min(n_a, n_b) > 1:
+        sig = SIGMA_COMP
+    else:
+        sig = SIGMA
+
+    # draw personal traits
+    sigma = sig * np.random.uniform(0, 1)
+    kapa = np.random.randint(1, KAPA + 1)
+    beta = BETA * np.random.uniform(0, 1)
+    gama = GAMA * np.random.uniform(0, 1)
+    psi = PSI * np.random.uniform(0, 1)
+    theta = THETA * np.random.uniform(0, 1)
+    wamb = WAMB * np.random.uniform(0, 1)
+
+    nfeed = 0
+    p_bias[nfeed] = beta / (beta + 1 + nfeed ** theta)
+    min_a = dist_a[0, 0]
+    min_b = dist_b[0, 0]
+    max_outcome = max(dist_a[n_a - 1, 0], dist_b[n_b - 1, 0])
+    sign_max = np.sign(max_outcome)
+
+    if min_a == min_b:
+        ratio_min = 1.0
+    elif np.sign(min_a) == np.sign(min_b):
+        ratio_min = min(abs(min_a), abs(min_b)) / max(abs(min_a), abs(min_b))
+    else:
+        ratio_min = 0.0
+
+    n_a_win = 0
+    n_b_win = 0
+    sum_pay_b = 0.0
+    out_range = max_outcome - min(min_a, min_b)
+
+    uni_a = np.full(n_a, 1 / n_a)
+    uni_b = np.full(n_b, 1 / n_b)
+    uev_a = np.dot(dist_a[:, 0], uni_a)
+    uev_b = np.dot(dist_b[:, 0], uni_b)
+    bev_a = np.dot(dist_a[:, 0], dist_a[:, 1])
+    if ambiguous:
+        bev_b = (1 - psi) * (uev_b + bev_a) / 2 + psi * min_b
+        p_est_b = np.empty(n_b)
+        mean_high_b = np.mean(dist_b[1:n_b, 0])
+        t_sp_min_b = (bev_b - mean_high_b) / (min_b - mean_high_b)
+        p_est_b[0] = min(1.0, max(0.0, t_sp_min_b))
+        for i in range(1, n_b):
+            p_est_b[i] = (1 - p_est_b[0]) / (n_b - 1)
+    else:
+        p_est_b = dist_b[:, 1].copy()
+        bev_b = np.dot(dist_b[:, 0], p_est_b)
+
+    # compute subjective dominance for this problem
+    subj_dom = 0.0
+    if not ambiguous:
+        if bev_a > bev_b and uev_a >= uev_b:
+            subj_dom = 1 - p_b_better
+        elif bev_a < bev_b and uev_a <= uev_b:
+            subj_dom = 1 - p_a_better
+
+    if min_a > dist_b[n_b - 1, 0] or min_b > dist_a[n_a - 1, 0]:
+        subj_dom = 1.0
+
+    # correct error rate as per subjective dominance component
+    sigma = sigma * (1 - subj_dom)
+    sigmat = sigma
+
+    # simulation of the 25 decisions
+    for trial in range(n_trials):
+        st_a = 0.0
+        st_b = 0.0
+        # mental simulations
+        for _ in range(kapa):
+            rnd_0 = np.random.uniform(0, 1)
+            rnd_1 = np.random.uniform(0, 1)
+            if rnd_0 > p_bias[nfeed]:  # unbiased tool
+                if nfeed == 0:
+                    outcome_a = _dist_sample(dist_a[:, 0], dist_a[:, 1], rnd_1)
+                    outcome_b = _dist_sample(dist_b[:, 0], p_est_b, rnd_1)
+                else:
+                    uniprobs = np.full(nfeed, 1 / nfeed)
+                    outcome_a = _dist_sample(obs_pay[0:nfeed, 0], uniprobs, rnd_1)
+                    outcome_b = _dist_sample(obs_pay[0:nfeed, 1], uniprobs, rnd_1)
+            elif rnd_0 > (2 / 3) * p_bias[nfeed]:  # uniform tool
+                outcome_a = _dist_sample(dist_a[:, 0], uni_a, rnd_1)
+                outcome_b = _dist_sample(dist_b[:, 0], uni_b, rnd_1)
+            elif rnd_0 > (1 / 3) * p_bias[nfeed]:  # contingent pessimism tool
+                if sign_max > 0 and ratio_min < gama:
+                    outcome_a = min_a
+                    outcome_b = min_b
+                else:
+                    outcome_a = _dist_sample(dist_a[:, 0], uni_a, rnd_1)
+                    outcome_b = _dist_sample(dist_b[:, 0], uni_b, rnd_1)
+            else:  # sign tool
+                if nfeed == 0:
+                    outcome_a = out_range * _dist_sample(
+                        np.sign(dist_a[:, 0]), dist_a[:, 1], rnd_1
+                    )
+                    outcome_b = out_range * _dist_sample(
+                        np.sign(dist_b[:, 0]), p_est_b, rnd_1
+                    )
+                else:
+                    uniprobs = np.full(nfeed, 1 / nfeed)
+                    outcome_a = out_range * _dist_sample(
+                        np.sign(obs_pay[0:nfeed, 0]), uniprobs, rnd_1
+                    )
+                    outcome_b = out_range * _dist_sample(
+                        np.sign(obs_pay[0:nfeed, 1]), uniprobs, rnd_1
+                    )
+
+            st_a += outcome_a
+            st_b += outcome_b
+
+        st_a = st_a / kapa
+        st_b = st_b / kapa
+
+        # error term; positive values contribute to attraction to A
+        error = sigmat * np.random.normal()
+
+        # decision
+        attraction_diff = (bev_a - bev_b) + (st_a - st_b) + error
+        if attraction_diff == 0:
+            decision[trial] = np.random.randint(0, 2)
+        else:
+            decision[trial] = 1.0 if attraction_diff < 0 else 0.0
+
+        if trial >= first_feedback - 1:
+            # handle feedback
+            nfeed += 1
+            p_bias[nfeed] = beta / (beta + 1 + nfeed ** theta)
+            rnd_obs = np.random.uniform(0, 1)
+            obs_pay[nfeed - 1, 0] = _dist_sample(dist_a[:, 0], dist_a[:, 1], rnd_obs)
+            if corr == 1:
+                obs_pay[nfeed - 1, 1] = _dist_sample(
+                    dist_b[:, 0], dist_b[:, 1], rnd_obs
+                )
+            elif corr == -1:
+                obs_pay[nfeed - 1, 1] = _dist_sample(
+                    dist_b[:, 0], dist_b[:, 1], 1 - rnd_obs
+                )
+            else:
+                obs_pay[nfeed - 1, 1] = _dist_sample(
+                    dist_b[:, 0], dist_b[:, 1], np.random.uniform(0, 1)
+                )
+
+            # update number of A or B "wins"
+            n_a_win += int(obs_pay[nfeed - 1, 0] >= obs_pay[nfeed - 1, 1])
+            n_b_win += int(obs_pay[nfeed - 1, 1] >= obs_pay[nfeed - 1, 0])
+            sum_pay_b += obs_pay[nfeed - 1, 1]
+            if ambiguous:
+                # update best estimate of B's EV
+                bev_b = (1 - wamb) * bev_b + wamb * obs_pay[nfeed - 1, 1]
+                avg_pay_b = sum_pay_b / nfeed
+                # update size of error in ambiguous problems
+                if subj_dom != 1:
+                    if bev_a > avg_pay_b and uev_a >= uev_b:
+                        sigmat *= 1 - n_a_win / nfeed
+                    elif bev_a < avg_pay_b and uev_a <= uev_b:
+                        sigmat *= 1 - n_b_win / nfeed
+
+    # compute B-rates for this simulation
+    block_size = n_trials // n_blocks
+    for b in range(n_blocks):
+        sim_pred[b] = np.mean(decision[b * block_size : (b + 1) * block_size])
+
+    return sim_pred
+
+
+@njit(cache=True)
+def _pred_one(dist_a, dist_b, amb, corr, p_a_better, p_b_better, nsim):
+    """
+    Average `nsim` virtual agent simulations into the BEAST.sd prediction of one problem.
+    """
+    prediction = np.zeros(5)
+    for _ in range(nsim):
+        prediction += _simulate_one_agent(
+            dist_a, dist_b, amb, corr, p_a_better, p_b_better
+        )
+    return prediction / nsim
+
+
+def CPC18_BEASTsd_pred_numba(stimulus, nsim=10, accuracy=100):
+    """
+    BEAST.sd prediction for one CPC18 problem row, computed fully in-process.
+
+    Parameters
+    ----------
+    stimulus : array-like
+        The 12 CPC18 problem parameters in the usual column order (Ha, pHa, La, LotShapeA,
+        LotNumA, Hb, pHb, Lb, LotShapeB, LotNumB, Amb, Corr), with the lottery shapes already
+        converted to numeric codes.
+
+    nsim : int
+        Number of virtual agents to average over.
+
+    accuracy : int
+        Number of samples used when estimating the pairwise better-option probabilities.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Prediction of the B-rate in each of the 5 blocks, shape (1, 5).
+    """
+    (ha, p_ha, la, shape_a, num_a, hb, p_hb, lb, shape_b, num_b, amb, corr) = stimulus
+    dist_a = np.ascontiguousarray(
+        CPC18_getDist(ha, p_ha, la, shape_a, num_a), dtype=np.float64
+    )
+    dist_b = np.ascontiguousarray(
+        CPC18_getDist(hb, p_hb, lb, shape_b, num_b), dtype=np.float64
+    )
+    p_a_better, p_b_better = _get_pbetter(dist_a, dist_b, 1, accuracy)
+    prediction = _pred_one(
+        dist_a, dist_b, int(amb), int(corr), p_a_better, p_b_better, nsim
+    )
+    return prediction.reshape(1, 5)
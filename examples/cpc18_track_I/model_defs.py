@@ -1,4 +1,7 @@
 from importlib import import_module
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
 from cognibench.models import CNBModel
 from cognibench.capabilities import ContinuousAction, ContinuousObservation
 from cognibench.continuous import ContinuousSpace
@@ -9,20 +12,91 @@ from cognibench.models.wrappers import (
 )
 
 
+def _pred_chunk_rowwise(pred_fn, chunk):
+    """
+    Predict one chunk of stimuli rows with a per-row prediction function. Module-level so it can
+    be pickled into worker processes.
+    """
+    return np.vstack([np.asarray(pred_fn(s)).reshape(1, -1) for s in chunk])
+
+
+def _pred_chunk_listwise(pred_fn, chunk):
+    """
+    Predict one chunk of stimuli rows with a prediction function that takes the whole chunk.
+    Module-level so it can be pickled into worker processes.
+    """
+    return np.vstack([np.asarray(p).reshape(1, -1) for p in pred_fn(chunk)])
+
+
+def _parallel_pred_batch(chunk_fn, stimuli, n_jobs):
+    """
+    Run independent row predictions over a pool of worker processes. Rows are split into a few
+    chunks per worker so that each inter-process round trip carries substantial work, instead of
+    paying the dispatch overhead once per row.
+    """
+    chunks = [c for c in np.array_split(np.asarray(stimuli), 4 * n_jobs) if len(c) > 0]
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return np.concatenate(list(executor.map(chunk_fn, chunks)))
+
+
+class BEASTsdNumba(CNBModel, ContinuousAction, ContinuousObservation):
+    """
+    Numba-compiled in-process port of the BEAST.sd reference implementation. Unlike the Octave
+    and R contestants, predictions do not cross any inter-process boundary, so this model is the
+    preferred one for judging large estimation sets; the external-language contestants remain
+    useful as correctness oracles.
+    """
+
+    name = "BEASTsdNumba"
+
+    def __init__(self, *args, n_jobs=1, **kwargs):
+        self.set_action_space(ContinuousSpace())
+        self.set_observation_space(ContinuousSpace())
+        from beastsd_numba import CPC18_BEASTsd_pred_numba
+
+        self.pred_fn = CPC18_BEASTsd_pred_numba
+        self.n_jobs = n_jobs
+        super().__init__(*args, **kwargs)
+
+    def predict(self, stimuli):
+        return [self.pred_fn(s) for s in stimuli]
+
+    def predict_batch(self, stimuli):
+        """
+        Predict all stimuli rows at once and return the B-rates as a single (N, 5) array.
+        Rows are distributed over `n_jobs` worker processes when `n_jobs > 1`.
+        """
+        chunk_fn = partial(_pred_chunk_rowwise, self.pred_fn)
+        if self.n_jobs > 1:
+            return _parallel_pred_batch(chunk_fn, stimuli, self.n_jobs)
+        return chunk_fn(stimuli)
+
+
 class BEASTsdPython(CNBModel, ContinuousAction, ContinuousObservation):
     name = "BEASTsdPython"
 
-    def __init__(self, *args, import_base_path, **kwargs):
+    def __init__(self, *args, import_base_path, n_jobs=1, **kwargs):
         self.set_action_space(ContinuousSpace())
         self.set_observation_space(ContinuousSpace())
         fn_name = "CPC18_BEASTsd_pred"
         module = import_module(f"{import_base_path}.{fn_name}")
         self.pred_fn = getattr(module, fn_name)
+        self.n_jobs = n_jobs
         super().__init__(*args, **kwargs)
 
     def predict(self, *args, **kwargs):
         return self.pred_fn(*args, **kwargs)
 
+    def predict_batch(self, stimuli):
+        """
+        Predict all stimuli rows at once and return the B-rates as a single (N, 5) array.
+        Rows are distributed over `n_jobs` worker processes when `n_jobs > 1`.
+        """
+        chunk_fn = partial(_pred_chunk_listwise, self.pred_fn)
+        if self.n_jobs > 1:
+            return _parallel_pred_batch(chunk_fn, stimuli, self.n_jobs)
+        return chunk_fn(stimuli)
+
 
 class BEASTsdOctave(
     OctaveWrapperMixin, CNBModel, ContinuousAction, ContinuousObservation
@@ -35,11 +109,10 @@ class BEASTsdOctave(
         OctaveWrapperMixin.__init__(
             self,
             import_base_path=import_base_path,
-            reset_fn=lambda oct_sess: oct_sess.eval("pkg load statistics;"),
+            session_setup_fn=lambda oct_sess: oct_sess.eval("pkg load statistics;"),
             predict_fn="CPC18_BEASTsd_pred",
         )
         CNBModel.__init__(self, *args, **kwargs)
-        self.reset()
 
 
 class BEASTsdMatlab(
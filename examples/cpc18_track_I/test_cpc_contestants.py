@@ -8,11 +8,25 @@ from sciunit import TestSuite
 from sciunit import settings as sciunit_settings
 from cognibench.settings import settings
 
-from model_defs import BEASTsdPython, BEASTsdOctave, BEASTsdR, BEASTsdMatlab
+from model_defs import (
+    BEASTsdNumba,
+    BEASTsdPython,
+    BEASTsdOctave,
+    BEASTsdR,
+    BEASTsdMatlab,
+)
 
 settings["CRASH_EARLY"] = True
 sciunit_settings["CWD"] = getcwd()
 
+# The Octave, R and Matlab contestants pay an inter-process round trip per predict call; enable
+# them only when validating the in-process implementations against the original ones.
+ENABLE_EXTERNAL = False
+
+# Number of worker processes used by the in-process contestants; each CPC18 row prediction is
+# independent, so rows are farmed out in coarse chunks.
+N_JOBS = 4
+
 
 def get_models(model_IDs, folder_name_fmt, model_name_fmt, model_ctor):
     models = []
@@ -59,29 +73,30 @@ if __name__ == "__main__":
     python_model_IDs = [0]
     octave_model_IDs = [1]
     r_model_IDs = [2]
-    models = (
-        get_models(
-            python_model_IDs,
-            "beastsd_contestant_{}",
-            "Contestant {} (Python)",
-            BEASTsdPython,
-        )
-        + get_models(
-            r_model_IDs, "beastsd_contestant_{}", "Contestant {} (R)", BEASTsdR
-        )
-        + get_models(
-            octave_model_IDs,
-            "beastsd_contestant_{}",
-            "Contestant {} (Octave)",
-            BEASTsdOctave,
-        )
-        + get_models(
-            octave_model_IDs,
-            "beastsd_contestant_{}",
-            "Contestant {} (Matlab)",
-            BEASTsdMatlab,
-        )
+    models = [BEASTsdNumba(name="Contestant 0 (Numba)", n_jobs=N_JOBS)] + get_models(
+        python_model_IDs,
+        "beastsd_contestant_{}",
+        "Contestant {} (Python)",
+        partialclass(BEASTsdPython, n_jobs=N_JOBS),
     )
+    if ENABLE_EXTERNAL:
+        models += (
+            get_models(
+                r_model_IDs, "beastsd_contestant_{}", "Contestant {} (R)", BEASTsdR
+            )
+            + get_models(
+                octave_model_IDs,
+                "beastsd_contestant_{}",
+                "Contestant {} (Octave)",
+                BEASTsdOctave,
+            )
+            + get_models(
+                octave_model_IDs,
+                "beastsd_contestant_{}",
+                "Contestant {} (Matlab)",
+                BEASTsdMatlab,
+            )
+        )
 
     # prepare tests
     MSEScore = partialclass(scores.MSEScore, min_score=0, max_score=1)
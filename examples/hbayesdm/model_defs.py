@@ -1,11 +1,52 @@
 import pandas as pd
 import numpy as np
-from scipy.stats import rv_discrete
 from cognibench.models import CNBModel
 from cognibench.capabilities import DiscreteAction, DiscreteObservation
 from cognibench.capabilities import PredictsLogpdf, ReturnsNumParams
 
 
+class _RowLogpmf:
+    """
+    logpmf of a single trial, backed by a row of a shared log-probability matrix. Actions are
+    1-indexed, matching the hBayesDM task data convention.
+    """
+
+    __slots__ = ("log_row",)
+
+    def __init__(self, log_row):
+        self.log_row = log_row
+
+    def __call__(self, action):
+        return self.log_row[int(action) - 1]
+
+    def batch(self, actions):
+        return self.log_row[np.asarray(actions, dtype=np.intp) - 1]
+
+
+class _LogpmfRows:
+    """
+    Sequence of per-trial logpmfs backed by one contiguous log-probability matrix. Iterating
+    yields a :class:`_RowLogpmf` per trial, so the object is a drop-in replacement for a list of
+    logpmf callables; scorers that know about the `batch` method can instead gather the value of
+    every trial's action with a single vectorized indexing operation.
+    """
+
+    __slots__ = ("log_probs",)
+
+    def __init__(self, log_probs):
+        self.log_probs = log_probs
+
+    def __len__(self):
+        return len(self.log_probs)
+
+    def __getitem__(self, idx):
+        return _RowLogpmf(self.log_probs[idx])
+
+    def batch(self, actions):
+        actions = np.asarray(actions, dtype=np.intp).reshape(-1) - 1
+        return self.log_probs[np.arange(len(actions)), actions]
+
+
 class HbayesdmModel(
     CNBModel, DiscreteAction, DiscreteObservation, PredictsLogpdf, ReturnsNumParams
 ):
@@ -31,19 +72,25 @@ class HbayesdmModel(
             print("self.n_hbayesdm_paras not defined; try fitting the model first.")
 
     def fit(self, stimuli, actions):
-        df = pd.DataFrame(data=stimuli, columns=self.col_names)
+        # wrap the stimuli buffer instead of copying it into the dataframe; hBayesDM only reads
+        # the columns when serializing its input, so a zero-copy view is enough
+        stimuli = np.ascontiguousarray(stimuli, dtype=np.float64)
+        df = pd.DataFrame(data=stimuli, columns=self.col_names, copy=False)
         hbayesdm_out = self.hbayesdm_model_func(
             data=df, inc_postpred=True, **self.kwargs
         )
         self.n_hbayesdm_paras = len(hbayesdm_out.parameters)
-        best_sample_id = np.argmax(hbayesdm_out.par_vals["log_lik"].mean(axis=1))
+        # sum(axis=1) picks the same sample as mean(axis=1) (argmax is scale invariant) while
+        # skipping the division pass over the row-reduction array
+        log_lik = np.asarray(hbayesdm_out.par_vals["log_lik"])
+        best_sample_id = int(log_lik.sum(axis=1).argmax())
+        # a basic slice, so this is a view into the posterior predictive array rather than a copy
         self.y_dist = hbayesdm_out.par_vals["y_dist"][best_sample_id]
 
     def predict(self, stimuli):
         pred_softmax = self.y_dist.reshape(-1, self.y_dist.shape[-1])
-
-        def convert_to_scipy(row):
-            return rv_discrete(values=(np.arange(1, 5), row)).logpmf
-
-        distributions = list(map(convert_to_scipy, pred_softmax))
-        return distributions
+        # mathematically each logpmf is just log(row[action - 1]); constructing one
+        # scipy.stats.rv_discrete per row only adds object creation and argument
+        # validation overhead, so index a precomputed log-probability matrix instead.
+        self.log_probs = np.log(np.clip(pred_softmax, 1e-300, 1.0))
+        return _LogpmfRows(self.log_probs)
@@ -112,6 +112,26 @@ class Test_LSSPDAgent(unittest.TestCase):
             npt.assert_almost_equal(self.agent.get_hidden_state()["alpha"], alpha)
         )
 
+    def test_predict_trajectory(self):
+        stimuli = np.array([[0, 1, 0], [1, 0, 1]], dtype=np.int8)
+        rewards = [1, 0.5]
+        actions = [1, 0.5]
+        logpdfs = self.agent.predict_trajectory(stimuli, rewards)
+        self.agent.reset()
+        for s, r, a, logpdf in zip(stimuli, rewards, actions, logpdfs):
+            self.assertAlmostEqual(logpdf(a), self.agent.eval_policy(s).logpdf(a))
+            self.agent.update(s, r, a, False)
+        w = self.agent.get_hidden_state()["w"]
+        alpha = self.agent.get_hidden_state()["alpha"]
+        self.agent.reset()
+        self.agent.predict_trajectory(stimuli, rewards)
+        self.assertIsNone(
+            npt.assert_almost_equal(self.agent.get_hidden_state()["w"], w)
+        )
+        self.assertIsNone(
+            npt.assert_almost_equal(self.agent.get_hidden_state()["alpha"], alpha)
+        )
+
     def test_reset(self):
         self.agent.reset()
         w = np.array([0.1, 0.1, 0.1], dtype=np.float64)
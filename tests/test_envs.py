@@ -30,6 +30,15 @@ class TestBanditEnv(unittest.TestCase):
         self.assertRaises(AssertionError, self.env.step, len(self.p_dist) + 1)
         self.assertTrue(0 <= self.env.reset() < len(self.p_dist))
 
+    def test_step_many(self):
+        actions = [0, 1, 2, 3, 0]
+        observations, rewards, dones, _ = self.env.step_many(actions)
+        self.assertEqual(len(observations), len(actions))
+        self.assertEqual(len(rewards), len(actions))
+        self.assertTrue(all(r in (0, 1) for r in rewards))
+        self.assertFalse(any(dones))
+        self.assertRaises(AssertionError, self.env.step_many, [0, -1])
+
 
 class TestClassicalConditioningEnv(unittest.TestCase):
     def setUp(self):
@@ -58,6 +67,19 @@ class TestClassicalConditioningEnv(unittest.TestCase):
             reset_in = reset_in or (reset_stim == s).all()
         self.assertTrue(reset_in)
 
+    def test_step_many(self):
+        actions = [0.1, 0.5, 0.9]
+        observations, rewards, dones, _ = self.env.step_many(actions)
+        self.assertEqual(len(observations), len(actions))
+        self.assertEqual(len(rewards), len(actions))
+        self.assertTrue(all(r in (0, 1) for r in rewards))
+        self.assertFalse(any(dones))
+        for obs in observations:
+            obs_in = False
+            for s in self.stimuli:
+                obs_in = obs_in or (obs == s).all()
+            self.assertTrue(obs_in)
+
 
 if __name__ == "__main__":
     unittest.main()